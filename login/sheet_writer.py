@@ -0,0 +1,135 @@
+# login/sheet_writer.py
+
+# --- Import Core Libraries ---
+import math
+import gspread
+
+# --- HELPER FUNCTIONS ---
+def quote_sheet_name(sheet_name):
+    """Returns the sheet name quoted for use in an A1 range, e.g. 'HR Requests Report'."""
+    return "'" + sheet_name.replace("'", "''") + "'"
+
+def cell_value(value):
+    """Converts a DataFrame cell into a JSON-safe value, the same way set_with_dataframe does."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    if isinstance(value, str):
+        # A leading apostrophe would be swallowed by USER_ENTERED parsing, so escape it.
+        return "'" + value if value.startswith("'") else value
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+class SheetWriter:
+    """
+    Collects the data and formatting for every target tab of one spreadsheet and
+    sends them in as few Sheets API requests as possible:
+
+      1. fetch_sheet_metadata (one GET: existing tabs, their sheetIds and filters)
+      2. batch_update         (add missing tabs, clear values, drop old filters, resize)
+      3. values_batch_update  (write every tab's header and rows)
+      4. batch_update         (set filters and auto-resize columns)
+
+    Requests go through the client's gspread 6 `http_client`, because `open_by_key`
+    would spend its own GET on metadata and then discard the sheet list.
+    The HTTP requests sent are counted in `api_calls` and printed after each flush.
+    """
+
+    def __init__(self, gc_client, spreadsheet_id):
+        self.http_client = gc_client.http_client
+        self.spreadsheet_id = spreadsheet_id
+        self.tabs = []
+        self.api_calls = {}
+
+    def add_tab(self, worksheet_name, df):
+        """Queues a DataFrame to replace the contents of the given worksheet."""
+        df_for_gsheet = df.fillna('')
+        values = [[str(col) for col in df_for_gsheet.columns]]
+        values += [[cell_value(v) for v in row] for row in df_for_gsheet.values.tolist()]
+        self.tabs.append({"name": worksheet_name, "values": values,
+                          "num_rows": len(values) - 1, "num_cols": len(df_for_gsheet.columns)})
+
+    def _call(self, method_name, *args):
+        self.api_calls[method_name] = self.api_calls.get(method_name, 0) + 1
+        return getattr(self.http_client, method_name)(self.spreadsheet_id, *args)
+
+    def _structure_requests(self, existing_sheets):
+        """
+        Builds the requests that get every tab to the right size with no values or filter.
+        Returns the requests and, for each new tab, the index of its addSheet request.
+        """
+        requests_batch = []
+        added_tabs = {}
+        for tab in self.tabs:
+            grid_properties = {"rowCount": max(tab["num_rows"] + 1, 2), "columnCount": max(tab["num_cols"], 1)}
+            sheet = existing_sheets.get(tab["name"])
+            if sheet is None:
+                print(f"⚠️ Worksheet '{tab['name']}' not found. It will be created.")
+                added_tabs[len(requests_batch)] = tab
+                requests_batch.append({"addSheet": {"properties": {
+                    "title": tab["name"], "gridProperties": grid_properties
+                }}})
+                continue
+            print(f"✅ Found existing worksheet: '{tab['name']}'")
+            tab["sheet_id"] = sheet["properties"]["sheetId"]
+            requests_batch.append({"updateCells": {"range": {"sheetId": tab["sheet_id"]}, "fields": "userEnteredValue"}})
+            if "basicFilter" in sheet:
+                requests_batch.append({"clearBasicFilter": {"sheetId": tab["sheet_id"]}})
+            requests_batch.append({"updateSheetProperties": {
+                "properties": {"sheetId": tab["sheet_id"], "gridProperties": grid_properties},
+                "fields": "gridProperties.rowCount,gridProperties.columnCount"
+            }})
+        return requests_batch, added_tabs
+
+    def _format_requests(self):
+        """Builds the filter and auto-resize requests for every tab that has rows."""
+        requests_batch = []
+        for tab in self.tabs:
+            if tab["num_rows"] == 0:
+                continue
+            requests_batch.append({"setBasicFilter": {"filter": {"range": {
+                "sheetId": tab["sheet_id"], "startRowIndex": 0, "endRowIndex": tab["num_rows"] + 1,
+                "startColumnIndex": 0, "endColumnIndex": tab["num_cols"]
+            }}}})
+            requests_batch.append({"autoResizeDimensions": {"dimensions": {
+                "sheetId": tab["sheet_id"], "dimension": "COLUMNS", "startIndex": 0, "endIndex": tab["num_cols"]
+            }}})
+        return requests_batch
+
+    def flush(self):
+        """Writes every queued tab. Returns False if the spreadsheet could not be opened."""
+        if not self.tabs:
+            print("ℹ️ No worksheets queued. Nothing to write.")
+            return True
+        print(f"ℹ️ Opening Google Sheet by ID: {self.spreadsheet_id}")
+        try:
+            metadata = self._call("fetch_sheet_metadata", {"fields": "sheets(properties(sheetId,title),basicFilter)"})
+        except gspread.exceptions.APIError as e:
+            if e.response.status_code != 404:
+                raise
+            print(f"❌ ERROR: Spreadsheet not found. Make sure the ID '{self.spreadsheet_id}' is correct and you have shared the sheet.")
+            return False
+        existing_sheets = {s["properties"]["title"]: s for s in metadata.get("sheets", [])}
+
+        structure_requests, added_tabs = self._structure_requests(existing_sheets)
+        print(f"ℹ️ Clearing and resizing {len(self.tabs)} worksheet(s)...")
+        response = self._call("batch_update", {"requests": structure_requests})
+        for index, tab in added_tabs.items():
+            tab["sheet_id"] = response["replies"][index]["addSheet"]["properties"]["sheetId"]
+
+        print(f"ℹ️ Writing {sum(tab['num_rows'] for tab in self.tabs)} rows across {len(self.tabs)} worksheet(s)...")
+        self._call("values_batch_update", {
+            "valueInputOption": "USER_ENTERED",
+            "data": [{"range": f"{quote_sheet_name(tab['name'])}!A1", "values": tab["values"]} for tab in self.tabs]
+        })
+
+        format_requests = self._format_requests()
+        if format_requests:
+            self._call("batch_update", {"requests": format_requests})
+
+        for tab in self.tabs:
+            print(f"✅ Success! Worksheet '{tab['name']}' has been updated with {tab['num_rows']} rows.")
+        summary = ", ".join(f"{name}={count}" for name, count in self.api_calls.items())
+        print(f"📊 Google Sheets API requests this run: {sum(self.api_calls.values())} ({summary})")
+        self.tabs = []
+        return True
@@ -7,8 +7,8 @@ import sys
 import re
 import pandas as pd
 import gspread
-from gspread_dataframe import set_with_dataframe
 from google.auth import default
+from sheet_writer import SheetWriter
 
 # --- AUTHENTICATION ---
 # This script assumes authentication is handled by the environment (e.g., GitHub Actions).
@@ -183,42 +183,28 @@ def process_submissions_to_df(submissions, field_mapping, column_definitions):
     print(f"✅ DataFrame processing complete with {len(df)} rows.")
     return df
 
+def build_accommodation_df():
+    """Fetches and processes the accommodation submissions. Returns None when there is nothing to write."""
+    submissions = fetch_all_submissions(HR_TEMPLATE_ID, HR_REPORT_NAME)
+    if not submissions:
+        print(f"ℹ️ No submissions were found for {HR_REPORT_NAME}.")
+        return None
+    df = process_submissions_to_df(submissions, HR_FIELD_MAPPING, HR_COLUMN_DEFINITIONS)
+    if df.empty:
+        print(f"ℹ️ DataFrame is empty after processing. Nothing to write.")
+        return None
+    return df
+
 def write_to_google_sheet(df, gc_client, spreadsheet_id, worksheet_name):
-    print(f"ℹ️ Opening Google Sheet by ID: {spreadsheet_id}")
-    try:
-        spreadsheet = gc_client.open_by_key(spreadsheet_id)
-    except gspread.exceptions.SpreadsheetNotFound:
-        print(f"❌ ERROR: Spreadsheet not found. Make sure ID is correct and shared.")
-        return
-    try:
-        worksheet = spreadsheet.worksheet(worksheet_name)
-        print(f"✅ Found existing worksheet: '{worksheet_name}'")
-    except gspread.exceptions.WorksheetNotFound:
-        print(f"⚠️ Worksheet '{worksheet_name}' not found. Creating it now...")
-        worksheet = spreadsheet.add_worksheet(title=worksheet_name, rows=100, cols=20)
-    df_for_gsheet = df.fillna('')
-    num_rows, num_cols = df_for_gsheet.shape
-    print(f"ℹ️ Clearing and rewriting worksheet '{worksheet_name}'...")
-    worksheet.clear()
-    try:
-        spreadsheet.batch_update({"requests": [{"clearBasicFilter": {"sheetId": worksheet.id}}]})
-    except Exception: pass
-    set_with_dataframe(worksheet, df_for_gsheet, row=1, col=1, include_index=False, include_column_header=True)
-    worksheet.resize(rows=max(num_rows + 1, 2), cols=num_cols if num_cols > 0 else 1) # Ensure sheet is not empty
-    if num_rows > 0:
-        spreadsheet.batch_update({"requests": [{"setBasicFilter": {"filter": {"range": {"sheetId": worksheet.id}}}}, {"autoResizeDimensions": {"dimensions": {"sheetId": worksheet.id, "dimension": "COLUMNS"}}}]})
-    print(f"✅ Success! Worksheet '{worksheet_name}' has been updated with {len(df_for_gsheet)} rows.")
+    writer = SheetWriter(gc_client, spreadsheet_id)
+    writer.add_tab(worksheet_name, df)
+    if not writer.flush():
+        sys.exit(f"❌ ERROR: Could not write worksheet '{worksheet_name}'.")
 
 # --- MAIN FLOW ---
 if __name__ == "__main__":
     print(f"\n--- STARTING REPORT: {HR_REPORT_NAME} ---")
-    submissions = fetch_all_submissions(HR_TEMPLATE_ID, HR_REPORT_NAME)
-    if submissions:
-        df = process_submissions_to_df(submissions, HR_FIELD_MAPPING, HR_COLUMN_DEFINITIONS)
-        if not df.empty:
-            write_to_google_sheet(df, gc, HR_GOOGLE_SHEET_ID, HR_WORKSHEET_NAME)
-        else:
-            print(f"ℹ️ DataFrame is empty after processing. Nothing to write.")
-    else:
-        print(f"ℹ️ No submissions were found for {HR_REPORT_NAME}.")
+    df = build_accommodation_df()
+    if df is not None:
+        write_to_google_sheet(df, gc, HR_GOOGLE_SHEET_ID, HR_WORKSHEET_NAME)
     print(f"--- FINISHED REPORT: {HR_REPORT_NAME} ---\n")
@@ -8,8 +8,8 @@ import re
 import pandas as pd
 import numpy as np
 import gspread
-from gspread_dataframe import set_with_dataframe
 from google.auth import default
+from sheet_writer import SheetWriter
 
 # --- AUTHENTICATION ---
 # This script assumes authentication is handled by the environment (e.g., GitHub Actions).
@@ -192,49 +192,28 @@ def process_hr_submissions_to_df(submissions):
     print("✅ DataFrame processing complete.")
     return df
 
+def build_hr_requests_df():
+    """Fetches and processes the HR request submissions. Returns None when there is nothing to write."""
+    submissions = fetch_all_submissions(TEMPLATE_ID)
+    if not submissions:
+        print("ℹ️ No submissions were found for this HR form.")
+        return None
+    df_hr = process_hr_submissions_to_df(submissions)
+    if df_hr.empty:
+        print("ℹ️ DataFrame is empty after processing. No data will be written.")
+        return None
+    return df_hr
+
 def write_to_google_sheet(df, gc_client):
-    print(f"ℹ️ Opening Google Sheet file by ID: {GOOGLE_SHEET_ID}")
-    try:
-        spreadsheet = gc_client.open_by_key(GOOGLE_SHEET_ID)
-    except gspread.exceptions.SpreadsheetNotFound:
-        print(f"❌ ERROR: Spreadsheet not found. Make sure the ID '{GOOGLE_SHEET_ID}' is correct and you have shared the sheet.")
-        return
-    try:
-        worksheet = spreadsheet.worksheet(HR_SHEET_NAME)
-        print(f"ℹ️ Found existing sheet named '{HR_SHEET_NAME}'.")
-    except gspread.exceptions.WorksheetNotFound:
-        print(f"⚠️ Sheet '{HR_SHEET_NAME}' not found. Creating a new one...")
-        worksheet = spreadsheet.add_worksheet(title=HR_SHEET_NAME, rows=1, cols=1)
-    df_for_gsheet = df.fillna('')
-    num_rows, num_cols = df_for_gsheet.shape
-    print(f"ℹ️ Clearing old data and writing {len(df_for_gsheet)} new rows...")
-    worksheet.clear()
-    set_with_dataframe(worksheet, df_for_gsheet, row=1, col=1, include_index=False, include_column_header=True)
-    worksheet.resize(rows=max(num_rows + 1, 2), cols=num_cols if num_cols > 0 else 1)
-    if num_rows > 0:
-        requests_batch = [
-            {"clearBasicFilter": {"sheetId": worksheet.id}},
-            {"setBasicFilter": {"filter": {"range": {
-                "sheetId": worksheet.id, "startRowIndex": 0, "endRowIndex": num_rows + 1,
-                "startColumnIndex": 0, "endColumnIndex": num_cols
-            }}}},
-            {"autoResizeDimensions": {"dimensions": {
-                "sheetId": worksheet.id, "dimension": "COLUMNS", "startIndex": 0, "endIndex": num_cols
-            }}}
-        ]
-        spreadsheet.batch_update({"requests": requests_batch})
-    print(f"✅ Success! The sheet '{HR_SHEET_NAME}' has been updated and formatted.")
+    writer = SheetWriter(gc_client, GOOGLE_SHEET_ID)
+    writer.add_tab(HR_SHEET_NAME, df)
+    if not writer.flush():
+        sys.exit(f"❌ ERROR: Could not write sheet '{HR_SHEET_NAME}'.")
 
 # --- Main Execution Flow ---
 if __name__ == "__main__":
     print("\n--- Starting HR Requests Form Sync ---")
-    submissions = fetch_all_submissions(TEMPLATE_ID)
-    if not submissions:
-        print("ℹ️ No submissions were found for this HR form.")
-    else:
-        df_hr = process_hr_submissions_to_df(submissions)
-        if df_hr.empty:
-            print("ℹ️ DataFrame is empty after processing. No data will be written.")
-        else:
-            write_to_google_sheet(df_hr, gc)
+    df_hr = build_hr_requests_df()
+    if df_hr is not None:
+        write_to_google_sheet(df_hr, gc)
     print("--- Script Finished ---\n")
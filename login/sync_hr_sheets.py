@@ -0,0 +1,28 @@
+# login/sync_hr_sheets.py
+
+# --- Import Core Libraries ---
+# Runs both HR syncs and writes their worksheets in one batched pass per spreadsheet.
+import sys
+import sync_hr_accommodation as accommodation
+import sync_hr_requests as hr_requests
+from sheet_writer import SheetWriter
+
+# --- MAIN FLOW ---
+if __name__ == "__main__":
+    writers = {}
+
+    print(f"\n--- STARTING REPORT: {accommodation.HR_REPORT_NAME} ---")
+    df = accommodation.build_accommodation_df()
+    if df is not None:
+        writers.setdefault(accommodation.HR_GOOGLE_SHEET_ID, SheetWriter(accommodation.gc, accommodation.HR_GOOGLE_SHEET_ID)).add_tab(accommodation.HR_WORKSHEET_NAME, df)
+
+    print("\n--- Starting HR Requests Form Sync ---")
+    df_hr = hr_requests.build_hr_requests_df()
+    if df_hr is not None:
+        writers.setdefault(hr_requests.GOOGLE_SHEET_ID, SheetWriter(hr_requests.gc, hr_requests.GOOGLE_SHEET_ID)).add_tab(hr_requests.HR_SHEET_NAME, df_hr)
+
+    print("\n--- Writing HR worksheets to Google Sheets ---")
+    for spreadsheet_id, writer in writers.items():
+        if not writer.flush():
+            sys.exit(f"❌ ERROR: Could not write the HR worksheets to spreadsheet '{spreadsheet_id}'.")
+    print("--- Script Finished ---\n")
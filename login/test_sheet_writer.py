@@ -0,0 +1,93 @@
+# login/test_sheet_writer.py
+
+import pandas as pd
+from sheet_writer import SheetWriter, cell_value
+
+# --- IN-MEMORY GSPREAD STAND-IN ---
+class FakeHTTPClient:
+    """Records every Sheets API request and keeps just enough state to answer them."""
+
+    def __init__(self, sheets):
+        self.sheets = sheets
+        self.calls = []
+        self.next_sheet_id = 1000
+
+    def fetch_sheet_metadata(self, spreadsheet_id, params=None):
+        self.calls.append(("fetch_sheet_metadata", None))
+        return {"sheets": [dict(sheet) for sheet in self.sheets]}
+
+    def batch_update(self, spreadsheet_id, body):
+        self.calls.append(("batch_update", body))
+        replies = []
+        for request in body["requests"]:
+            if "addSheet" in request:
+                properties = dict(request["addSheet"]["properties"], sheetId=self.next_sheet_id)
+                self.next_sheet_id += 1
+                self.sheets.append({"properties": properties})
+                replies.append({"addSheet": {"properties": properties}})
+            else:
+                replies.append({})
+        return {"replies": replies}
+
+    def values_batch_update(self, spreadsheet_id, body=None):
+        self.calls.append(("values_batch_update", body))
+        return {}
+
+class FakeClient:
+    def __init__(self, sheets):
+        self.http_client = FakeHTTPClient(sheets)
+
+def requests_named(body, name):
+    return [request[name] for request in body["requests"] if name in request]
+
+# --- TESTS ---
+def test_two_tabs_are_written_in_four_requests():
+    gc = FakeClient([
+        {"properties": {"sheetId": 7, "title": "HR Accommodation Data"}, "basicFilter": {}},
+    ])
+    writer = SheetWriter(gc, "sheet-id")
+    writer.add_tab("HR Accommodation Data", pd.DataFrame({"A": ["x", "y"], "B": ["1", "2"]}))
+    writer.add_tab("HR Requests Report", pd.DataFrame({"C": ["z"]}))
+
+    assert writer.flush()
+    assert [name for name, _ in gc.http_client.calls] == [
+        "fetch_sheet_metadata", "batch_update", "values_batch_update", "batch_update"
+    ]
+    assert writer.api_calls == {"fetch_sheet_metadata": 1, "batch_update": 2, "values_batch_update": 1}
+
+    structure, values, formatting = (body for _, body in gc.http_client.calls[1:])
+    added = requests_named(structure, "addSheet")
+    assert [a["properties"]["title"] for a in added] == ["HR Requests Report"]
+    assert "sheetId" not in added[0]["properties"]
+    assert requests_named(structure, "clearBasicFilter") == [{"sheetId": 7}]
+    assert [d["range"] for d in values["data"]] == ["'HR Accommodation Data'!A1", "'HR Requests Report'!A1"]
+    assert values["data"][0]["values"] == [["A", "B"], ["x", "1"], ["y", "2"]]
+    filters = requests_named(formatting, "setBasicFilter")
+    assert [f["filter"]["range"]["sheetId"] for f in filters] == [7, 1000]
+
+def test_filter_is_only_cleared_when_one_exists():
+    gc = FakeClient([{"properties": {"sheetId": 3, "title": "HR Requests Report"}}])
+    writer = SheetWriter(gc, "sheet-id")
+    writer.add_tab("HR Requests Report", pd.DataFrame({"C": ["z"]}))
+
+    assert writer.flush()
+    structure = gc.http_client.calls[1][1]
+    assert requests_named(structure, "clearBasicFilter") == []
+    assert requests_named(structure, "addSheet") == []
+
+def test_formatting_is_skipped_when_every_tab_is_empty():
+    gc = FakeClient([{"properties": {"sheetId": 3, "title": "HR Requests Report"}}])
+    writer = SheetWriter(gc, "sheet-id")
+    writer.add_tab("HR Requests Report", pd.DataFrame(columns=["C"]))
+
+    assert writer.flush()
+    assert [name for name, _ in gc.http_client.calls] == [
+        "fetch_sheet_metadata", "batch_update", "values_batch_update"
+    ]
+
+def test_cell_value_escapes_apostrophes_and_blanks_nan():
+    assert cell_value("'007") == "''007"
+    assert cell_value("plain") == "plain"
+    assert cell_value(float("nan")) == ""
+    assert cell_value(None) == ""
+    assert type(cell_value(pd.Series([5]).iloc[0])) is int